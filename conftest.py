@@ -0,0 +1 @@
+# Lets tests import the app modules from the repository root
@@ -0,0 +1,241 @@
+import argparse
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from dotenv import load_dotenv
+from router import build_router
+
+# Read .env before the settings below, as the app does
+load_dotenv()
+
+INTERVIEWS_DIR = os.getenv("INTERVIEWS_DIR", "saved_interviews")
+EVALUATION_ROUTE = "evaluation"     # falls back to the router's default route
+EVALUATION_MAX_TOKENS = 600
+MAX_ANSWER_CHARS = 1200             # per message, keeps the evaluation prompt short
+DEFAULT_WORKERS = 4
+
+# "7/10", "7 out of 10", "7 dari 10", "7 sur 10", ... in the interviewer's closing assessment
+ASSESSMENT_SCORE_RE = re.compile(r"\b(10|[1-9])\s*(/|out of|dari|sur|de|van|分)\s*10\b", re.IGNORECASE)
+
+EVALUATION_PROMPT = (
+    "You evaluate job interviews. Score each question/answer pair from 1 to 10, "
+    "give an overall score from 1 to 10 and short recommendations. "
+    "Reply with JSON only, matching the provided schema."
+)
+
+EVALUATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "questions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "question": {"type": "string"},
+                    "score": {"type": "integer", "minimum": 1, "maximum": 10},
+                    "comment": {"type": "string"},
+                },
+                "required": ["question", "score", "comment"],
+            },
+        },
+        "overall_score": {"type": "integer", "minimum": 1, "maximum": 10},
+        "recommendations": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["questions", "overall_score", "recommendations"],
+}
+
+
+class EvaluationError(Exception):
+    """Raised when the model's evaluation can't be parsed."""
+
+
+def interview_path(name, directory=INTERVIEWS_DIR):
+    return os.path.join(directory, f"{name}.json")
+
+
+def evaluation_path(name, directory=INTERVIEWS_DIR):
+    return os.path.join(directory, f"{name}.eval.json")
+
+
+def save_interview(name, messages, metadata=None, directory=INTERVIEWS_DIR):
+    """Persist a conversation to disk so it can be evaluated later."""
+    os.makedirs(directory, exist_ok=True)
+    record = {
+        "name": name,
+        "saved_at": datetime.now().isoformat(timespec="seconds"),
+        "metadata": metadata or {},
+        "messages": messages,
+    }
+    with open(interview_path(name, directory), "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, indent=2)
+    return record
+
+
+def load_interview(name, directory=INTERVIEWS_DIR):
+    with open(interview_path(name, directory), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def list_interviews(directory=INTERVIEWS_DIR):
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        filename[:-len(".json")] for filename in os.listdir(directory)
+        if filename.endswith(".json") and not filename.endswith(".eval.json")
+    )
+
+
+def is_closing_assessment(text):
+    """Whether an interviewer message is its free-text judgement with a score."""
+    return bool(ASSESSMENT_SCORE_RE.search(text or ""))
+
+
+def compact_transcript(messages):
+    """Turn a conversation into a short Q/A transcript without prompts, CV text or verdict."""
+    lines = []
+    last_answer = max(
+        (i for i, msg in enumerate(messages) if msg["role"] == "user" and i != 1),
+        default=-1,
+    )
+    for i, msg in enumerate(messages):
+        # The system prompt and the first user message carry the CV and instructions
+        if msg["role"] == "system" or (i == 1 and msg["role"] == "user"):
+            continue
+        # Leave out the chat model's own score so it doesn't anchor the evaluation;
+        # trailing interviewer messages have no answer to score anyway
+        if msg["role"] == "assistant" and (i > last_answer or is_closing_assessment(msg["content"])):
+            continue
+        label = "Q" if msg["role"] == "assistant" else "A"
+        content = re.sub(r"\s+", " ", msg["content"]).strip()
+        if len(content) > MAX_ANSWER_CHARS:
+            content = content[:MAX_ANSWER_CHARS] + "..."
+        lines.append(f"{label}: {content}")
+    return "\n".join(lines)
+
+
+def parse_score(value):
+    """Return a 1-10 integer score, rejecting anything that isn't a number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise EvaluationError(f"Invalid score: {value!r}")
+    return min(10, max(1, int(round(value))))
+
+
+def parse_evaluation(text):
+    """Parse and sanity-check the model's JSON reply."""
+    match = re.search(r"\{.*\}", text or "", re.DOTALL)
+    if not match:
+        raise EvaluationError("No JSON object in evaluation response")
+    try:
+        result = json.loads(match.group(0))
+    except json.JSONDecodeError as e:
+        raise EvaluationError(f"Invalid evaluation JSON: {e}")
+
+    if not isinstance(result, dict):
+        raise EvaluationError("Evaluation is not a JSON object")
+    for key in EVALUATION_SCHEMA["required"]:
+        if key not in result:
+            raise EvaluationError(f"Evaluation is missing '{key}'")
+    if not isinstance(result["questions"], list) or not all(isinstance(q, dict) for q in result["questions"]):
+        raise EvaluationError("Evaluation 'questions' must be a list of objects")
+    if not isinstance(result["recommendations"], list):
+        raise EvaluationError("Evaluation 'recommendations' must be a list")
+
+    result["overall_score"] = parse_score(result["overall_score"])
+    for question in result["questions"]:
+        question["score"] = parse_score(question.get("score"))
+        question.setdefault("question", "")
+        question.setdefault("comment", "")
+    return result
+
+
+def evaluate_interview(router, record):
+    """Run one structured evaluation call for a saved interview."""
+    metadata = record.get("metadata", {})
+    context = ", ".join(f"{key}: {value}" for key, value in metadata.items() if value)
+    transcript = compact_transcript(record["messages"])
+    if not transcript:
+        raise EvaluationError("Interview has no questions or answers to evaluate")
+    response = router.create(
+        EVALUATION_ROUTE,
+        [
+            {"role": "system", "content": EVALUATION_PROMPT},
+            {"role": "user", "content": f"{context}\n\n{transcript}"},
+        ],
+        temperature=0,
+        max_tokens=EVALUATION_MAX_TOKENS,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {"name": "interview_evaluation", "schema": EVALUATION_SCHEMA},
+        },
+    )
+    result = parse_evaluation(response.choices[0].message.content)
+    result["name"] = record["name"]
+    result["saved_at"] = record["saved_at"]
+    result["metadata"] = metadata
+    result["evaluated_at"] = datetime.now().isoformat(timespec="seconds")
+    return result
+
+
+def evaluate_and_store(router, name, directory=INTERVIEWS_DIR):
+    """Evaluate a saved interview and write the result next to it."""
+    result = evaluate_interview(router, load_interview(name, directory))
+    with open(evaluation_path(name, directory), "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    return result
+
+
+def evaluate_all(router, directory=INTERVIEWS_DIR, workers=DEFAULT_WORKERS, force=False):
+    """Evaluate every stored interview with at most `workers` calls in flight."""
+    names = [
+        name for name in list_interviews(directory)
+        if force or not os.path.exists(evaluation_path(name, directory))
+    ]
+
+    def run(name):
+        try:
+            return evaluate_and_store(router, name, directory)
+        except Exception as e:
+            print(f"Error evaluating {name}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [result for result in executor.map(run, names) if result]
+
+
+def rank_candidates(directory=INTERVIEWS_DIR, date=None):
+    """Return stored evaluations best first, optionally only for one YYYY-MM-DD day."""
+    evaluations = []
+    for name in list_interviews(directory):
+        path = evaluation_path(name, directory)
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            evaluation = json.load(f)
+        if date and not evaluation["saved_at"].startswith(date):
+            continue
+        evaluations.append(evaluation)
+    return sorted(evaluations, key=lambda e: e["overall_score"], reverse=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate and rank saved interviews")
+    parser.add_argument("command", choices=["evaluate", "rank"])
+    parser.add_argument("--dir", default=INTERVIEWS_DIR)
+    parser.add_argument("--routes", default=os.getenv("MODEL_ROUTES_FILE"),
+                        help="model routes JSON (defaults to MODEL_ROUTES_FILE, else the built-in routes)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--force", action="store_true", help="re-evaluate interviews that already have a result")
+    parser.add_argument("--date", help="only rank interviews saved on this day (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    if args.command == "evaluate":
+        router = build_router(args.routes, api_key=os.getenv("OPENAI_API_KEY"))
+        results = evaluate_all(router, args.dir, workers=args.workers, force=args.force)
+        print(f"Evaluated {len(results)} interview(s)")
+    else:
+        for rank, evaluation in enumerate(rank_candidates(args.dir, args.date), start=1):
+            job = evaluation["metadata"].get("job_applied", "")
+            print(f"{rank}. {evaluation['name']} ({job}): {evaluation['overall_score']}/10")
@@ -3,256 +3,31 @@ import tiktoken
 import requests
 import os
 import streamlit as st
-import fitz
 from dotenv import load_dotenv
+from router import build_router, DEFAULT_BASE_URL, DEFAULT_MODEL, DEFAULT_MAX_TOKENS, DEFAULT_TOKEN_BUDGET
+from pdf_ingest import ingest_pdf, PDFIngestionError
+from translations import LANGUAGES, get_translator
+from profiler import RerunProfiler
 
 load_dotenv()
+from evaluation import save_interview, evaluate_and_store, is_closing_assessment
 from datetime import datetime
 import json
 import csv
 import io
 import re
+import hashlib
+
+# Rerun profiling, enabled with HIREHELP_PROFILE=1
+if 'profiler' not in st.session_state:
+    st.session_state['profiler'] = RerunProfiler()
+profiler = st.session_state['profiler']
+profiler.start_rerun()
 
 # Initialize conversation history if it doesn't exist
 if 'conversation_history' not in st.session_state:
     st.session_state['conversation_history'] = []
 
-TRANSLATIONS = {
-    "English": {
-        "system_message": "You are an interviewer, asking insightful questions based on the provided document. Ask the question one at a time as to not overwhelm the user.",
-        "interview_type": "Interview Type",
-        "job_applied": "Job Position",
-        "qualifications": "Required Qualifications",
-        "upload_pdf": "Upload a PDF for interview content",
-        "start_interview": "Start Interview",
-        "chat_placeholder": "Write a message",
-        "custom_input": "Enter Interview Type",
-        "custom_placeholder": "e.g., Coding Test",
-        "selected_type": "Selected Interview Type",
-        "job_placeholder": "e.g., Software Engineer",
-        "qual_placeholder": "Enter the qualifications required for this position",
-        "pdf_loaded": "PDF content loaded. The chatbot is now ready to ask questions based on this document.",
-        "lets_start": "Let's start the interview! Interview type: ",
-        "instance_id": "EC2 Instance ID",
-        "search_options": "Search Options",
-        "case_sensitive": "Case Sensitive",
-        "match_whole_words": "Match Whole Words",
-        "search_in_conversation": "Search in conversation",
-        "export_options": "Export Options",
-        "choose_export_format": "Choose export format",
-        "export_conversation": "Export Conversation",
-        "no_conversation": "No conversation to export!",
-        "clear_conversation": "Clear Conversation",
-        "clear_confirm": "Are you sure you want to clear the conversation?",
-        "yes": "Yes",
-        "no": "No",
-        "save_conversation": "Save Conversation",
-        "load_saved": "Load Saved Conversation",
-        "load": "Load",
-        "generate_summary": "Generate Conversation Summary",
-        "conversation_summary": "Conversation Summary",
-        "no_summary": "No conversation to summarize yet!",
-        "response_settings": "Response Settings",
-        "word_limit": "User's Message Word Limit",
-        "word_limit_help": "Adjust the maximum number of words in the user's input",
-        "input_exceeds": "⚠️ Input exceeds word limit!"
-    },
-    "Bahasa Indonesia": {
-        "system_message": "Anda adalah pewawancara, mengajukan pertanyaan berdasarkan dokumen yang diberikan. Tanyakan pertanyaan satu per satu agar tidak membebani pengguna.",
-        "interview_type": "Jenis Interview",
-        "job_applied": "Posisi Pekerjaan", 
-        "qualifications": "Kualifikasi yang Dibutuhkan",
-        "upload_pdf": "Unggah PDF untuk konten interview",
-        "start_interview": "Mulai Interview",
-        "chat_placeholder": "Tulis pesan",
-        "custom_input": "Masukkan Jenis Interview",
-        "custom_placeholder": "Misalnya: Coding Test", 
-        "selected_type": "Jenis Interview yang Dipilih",
-        "job_placeholder": "Misalnya: Software Engineer",
-        "qual_placeholder": "Tuliskan kualifikasi yang diperlukan untuk posisi ini",
-        "pdf_loaded": "Konten PDF dimuat. Chatbot siap mengajukan pertanyaan berdasarkan dokumen ini.",
-        "lets_start": "Ayo kita mulai interviewnya! Jenis interview: ",
-        "instance_id": "ID Instance EC2",
-        "search_options": "Opsi Pencarian",
-        "case_sensitive": "Sesuai Huruf Besar/Kecil", 
-        "match_whole_words": "Cocokkan Kata Lengkap",
-        "search_in_conversation": "Cari dalam percakapan",
-        "export_options": "Opsi Ekspor",
-        "choose_export_format": "Pilih format ekspor",
-        "export_conversation": "Ekspor Percakapan", 
-        "no_conversation": "Belum ada percakapan untuk diekspor!",
-        "clear_conversation": "Hapus Percakapan",
-        "clear_confirm": "Apakah Anda yakin ingin menghapus percakapan?",
-        "yes": "Ya",
-        "no": "Tidak",
-        "save_conversation": "Simpan Percakapan",
-        "load_saved": "Muat Percakapan Tersimpan",
-        "load": "Muat",
-        "generate_summary": "Buat Ringkasan Percakapan",
-        "conversation_summary": "Ringkasan Percakapan",
-        "no_summary": "Belum ada percakapan untuk diringkas!",
-        "response_settings": "Pengaturan Respons",
-        "word_limit": "Batas Kata Respons",
-        "word_limit_help": "Sesuaikan jumlah maksimum kata dalam respons AI",
-        "input_exceeds": "⚠️ Input melebihi batas kata!"
-    },
-    "French": {
-        "system_message": "Vous êtes un intervieweur, posant des questions pertinentes basées sur le document fourni. Posez les questions une à la fois pour ne pas submerger l'utilisateur.",
-        "interview_type": "Type d'entretien",
-        "job_applied": "Poste",
-        "qualifications": "Qualifications requises",
-        "upload_pdf": "Télécharger un PDF pour le contenu de l'entretien",
-        "start_interview": "Commencer l'entretien",
-        "chat_placeholder": "Écrire un message",
-        "custom_input": "Entrer le type d'entretien",
-        "custom_placeholder": "ex: Test de codage",
-        "selected_type": "Type d'entretien sélectionné",
-        "job_placeholder": "ex: Ingénieur logiciel",
-        "qual_placeholder": "Entrez les qualifications requises pour ce poste",
-        "pdf_loaded": "Contenu PDF chargé. Le chatbot est maintenant prêt à poser des questions basées sur ce document.",
-        "lets_start": "Commençons l'entretien! Type d'entretien: ",
-        "instance_id": "ID d'instance EC2",
-        "search_options": "Options de recherche",
-        "case_sensitive": "Sensible à la casse",
-        "match_whole_words": "Correspondance mot entier",
-        "search_in_conversation": "Rechercher dans la conversation",
-        "export_options": "Options d'exportation",
-        "choose_export_format": "Choisir le format d'exportation",
-        "export_conversation": "Exporter la conversation",
-        "no_conversation": "Pas de conversation à exporter!",
-        "clear_conversation": "Effacer la conversation",
-        "clear_confirm": "Êtes-vous sûr de vouloir effacer la conversation?",
-        "yes": "Oui",
-        "no": "Non", 
-        "save_conversation": "Sauvegarder la conversation",
-        "load_saved": "Charger une conversation sauvegardée",
-        "load": "Charger",
-        "generate_summary": "Générer un résumé de la conversation",
-        "conversation_summary": "Résumé de la conversation",
-        "no_summary": "Pas encore de conversation à résumer!",
-        "response_settings": "Paramètres de réponse",
-        "word_limit": "Limite de mots pour la réponse",
-        "word_limit_help": "Ajuster le nombre maximum de mots dans les réponses de l'IA",
-        "input_exceeds": "⚠️ La saisie dépasse la limite de mots!"
-    },
-    "Spanish": {
-        "system_message": "Eres un entrevistador, haciendo preguntas perspicaces basadas en el documento proporcionado. Haz las preguntas una a la vez para no abrumar al usuario.",
-        "interview_type": "Tipo de entrevista",
-        "job_applied": "Puesto de trabajo",
-        "qualifications": "Cualificaciones requeridas",
-        "upload_pdf": "Subir un PDF para el contenido de la entrevista",
-        "start_interview": "Comenzar entrevista",
-        "chat_placeholder": "Escribir un mensaje",
-        "custom_input": "Introducir tipo de entrevista",
-        "custom_placeholder": "ej: Prueba de código",
-        "selected_type": "Tipo de entrevista seleccionado",
-        "job_placeholder": "ej: Ingeniero de software",
-        "qual_placeholder": "Introduce las cualificaciones requeridas para este puesto",
-        "pdf_loaded": "Contenido PDF cargado. El chatbot está ahora listo para hacer preguntas basadas en este documento.",
-        "lets_start": "¡Comencemos la entrevista! Tipo de entrevista: ",
-        "instance_id": "ID de instancia EC2",
-        "search_options": "Opciones de búsqueda",
-        "case_sensitive": "Distinguir mayúsculas y minúsculas",
-        "match_whole_words": "Coincidir palabras completas",
-        "search_in_conversation": "Buscar en la conversación",
-        "export_options": "Opciones de exportación",
-        "choose_export_format": "Elegir formato de exportación",
-        "export_conversation": "Exportar conversación",
-        "no_conversation": "¡No hay conversación para exportar!",
-        "clear_conversation": "Borrar conversación",
-        "clear_confirm": "¿Estás seguro de que quieres borrar la conversación?",
-        "yes": "Sí",
-        "no": "No",
-        "save_conversation": "Guardar conversación",
-        "load_saved": "Cargar conversación guardada",
-        "load": "Cargar",
-        "generate_summary": "Generar resumen de la conversación",
-        "conversation_summary": "Resumen de la conversación",
-        "no_summary": "¡Aún no hay conversación para resumir!",
-        "response_settings": "Configuración de respuesta",
-        "word_limit": "Límite de palabras de respuesta",
-        "word_limit_help": "Ajustar el número máximo de palabras en las respuestas de la IA",
-        "input_exceeds": "⚠️ ¡La entrada excede el límite de palabras!"
-    },
-    "Dutch": {
-        "system_message": "U bent een interviewer die inzichtelijke vragen stelt op basis van het verstrekte document. Stel de vragen één voor één om de gebruiker niet te overweldigen.",
-        "interview_type": "Type interview",
-        "job_applied": "Functie",
-        "qualifications": "Vereiste kwalificaties",
-        "upload_pdf": "Upload een PDF voor interview inhoud",
-        "start_interview": "Start interview",
-        "chat_placeholder": "Schrijf een bericht",
-        "custom_input": "Voer type interview in",
-        "custom_placeholder": "bijv: Coding Test",
-        "selected_type": "Geselecteerd type interview",
-        "job_placeholder": "bijv: Software Engineer",
-        "qual_placeholder": "Voer de vereiste kwalificaties in voor deze functie",
-        "pdf_loaded": "PDF-inhoud geladen. De chatbot is nu klaar om vragen te stellen op basis van dit document.",
-        "lets_start": "Laten we het interview beginnen! Type interview: ",
-        "instance_id": "EC2 Instance ID",
-        "search_options": "Zoekopties",
-        "case_sensitive": "Hoofdlettergevoelig",
-        "match_whole_words": "Hele woorden matchen",
-        "search_in_conversation": "Zoeken in gesprek",
-        "export_options": "Exportopties",
-        "choose_export_format": "Kies exportformaat",
-        "export_conversation": "Gesprek exporteren",
-        "no_conversation": "Geen gesprek om te exporteren!",
-        "clear_conversation": "Gesprek wissen",
-        "clear_confirm": "Weet je zeker dat je het gesprek wilt wissen?",
-        "yes": "Ja",
-        "no": "Nee",
-        "save_conversation": "Gesprek opslaan",
-        "load_saved": "Opgeslagen gesprek laden",
-        "load": "Laden",
-        "generate_summary": "Gespreksamenvatting genereren",
-        "conversation_summary": "Gespreksamenvatting",
-        "no_summary": "Nog geen gesprek om samen te vatten!",
-        "response_settings": "Antwoordinstellingen",
-        "word_limit": "Woordlimiet antwoord",
-        "word_limit_help": "Pas het maximale aantal woorden in AI-antwoorden aan",
-        "input_exceeds": "⚠️ Invoer overschrijdt woordlimiet!"
-    },
-    "Chinese": {
-        "system_message": "您是一位面试官，根据提供的文档提出富有洞察力的问题。一次只问一个问题，以免让用户应接不暇。",
-        "interview_type": "面试类型",
-        "job_applied": "应聘职位",
-        "qualifications": "所需资格",
-        "upload_pdf": "上传PDF面试内容",
-        "start_interview": "开始面试",
-        "chat_placeholder": "输入消息",
-        "custom_input": "输入面试类型",
-        "custom_placeholder": "例如：编程测试",
-        "selected_type": "已选择的面试类型",
-        "job_placeholder": "例如：软件工程师",
-        "qual_placeholder": "输入此职位所需的资格条件",
-        "pdf_loaded": "PDF内容已加载。聊天机器人现在准备根据此文档提问。",
-        "lets_start": "让我们开始面试！面试类型：",
-        "instance_id": "EC2实例ID",
-        "search_options": "搜索选项",
-        "case_sensitive": "区分大小写",
-        "match_whole_words": "匹配整词",
-        "search_in_conversation": "在对话中搜索",
-        "export_options": "导出选项",
-        "choose_export_format": "选择导出格式",
-        "export_conversation": "导出对话",
-        "no_conversation": "没有对话可导出！",
-        "clear_conversation": "清除对话",
-        "clear_confirm": "您确定要清除对话吗？",
-        "yes": "是",
-        "no": "否",
-        "save_conversation": "保存对话",
-        "load_saved": "加载已保存的对话",
-        "load": "加载",
-        "generate_summary": "生成对话摘要",
-        "conversation_summary": "对话摘要",
-        "no_summary": "还没有对话可以总结！",
-        "response_settings": "回复设置",
-        "word_limit": "回复字数限制",
-        "word_limit_help": "调整AI回复的最大字数",
-        "input_exceeds": "⚠️ 输入超过字数限制！"
-    }
-}
 
 # word counter
 def count_words(text):
@@ -262,13 +37,22 @@ def count_words(text):
 
 # Default settings
 DEFAULT_API_KEY = os.getenv("OPENAI_API_KEY")
-DEFAULT_BASE_URL = "https://api.together.xyz/v1"
-DEFAULT_MODEL = "meta-llama/Llama-Vision-Free"
-CODING_MODEL = "Qwen/Qwen2.5-Coder-32B-Instruct"
 DEFAULT_TEMPERATURE = 0.7
-DEFAULT_MAX_TOKENS = 512
-DEFAULT_TOKEN_BUDGET = 4096
 DEFAULT_WORD_LIMIT = 150
+MODEL_ROUTES_FILE = os.getenv("MODEL_ROUTES_FILE")
+
+
+@st.cache_resource
+def get_model_router():
+    """Build the model router once per process so endpoint health is shared across sessions."""
+    return build_router(MODEL_ROUTES_FILE, api_key=DEFAULT_API_KEY)
+
+
+def route_for_interview(interview_type):
+    """Map an interview type to its model route"""
+    if "coding" in interview_type.lower() or interview_type == "Technical Skill":
+        return "coding"
+    return "general"
 
 
 class ConversationManager:
@@ -284,9 +68,36 @@ class ConversationManager:
         self.max_tokens = max_tokens if max_tokens else DEFAULT_MAX_TOKENS
         self.token_budget = token_budget if token_budget else DEFAULT_TOKEN_BUDGET
         self.word_limit = word_limit if word_limit else DEFAULT_WORD_LIMIT  # Add this line
+        self.router = None
+        self.route = None
         self.system_message = f"You are an interviewer, asking insightful questions based on the provided document. Ask the question one at a time as to not overwhelm the user."
         self.conversation_history = [{"role": "system", "content": self.system_message}]
 
+    def use_route(self, router, route_name):
+        """Send completions through a model router and adopt the route's token budgets"""
+        route = router.get_route(route_name)
+        self.router = router
+        self.route = route.name
+        self.model = route.endpoints[0].model
+        self.max_tokens = route.max_tokens
+        self.token_budget = route.token_budget
+
+    def create_completion(self, messages, temperature, max_tokens, model=None):
+        """Run a completion through the router when one is set, otherwise through the client"""
+        if self.router is not None and model is None:
+            return self.router.create(
+                self.route,
+                messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        return self.client.chat.completions.create(
+            model=model if model is not None else self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
     def update_word_limit(self, new_limit):
         """Update the word limit for responses"""
         self.word_limit = new_limit
@@ -319,17 +130,16 @@ class ConversationManager:
         """Generate a chat completion with word limit consideration"""
         temperature = temperature if temperature is not None else self.temperature
         max_tokens = max_tokens if max_tokens is not None else self.max_tokens
-        model = model if model is not None else self.model
 
         self.conversation_history.append({"role": "user", "content": prompt})
         self.enforce_token_budget()
 
         try:
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=self.conversation_history,
+            response = self.create_completion(
+                self.conversation_history,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                model=model,
             )
             ai_response = response.choices[0].message.content
             self.conversation_history.append({"role": "assistant", "content": ai_response})
@@ -383,12 +193,21 @@ def get_instance_id():
     
 # PDF Parsing Function
 def parse_pdf(file):
-    """Extract text from a PDF file using PyMuPDF."""
-    content = ""
-    with fitz.open(stream=file.read(), filetype="pdf") as pdf:
-        for page_num in range(len(pdf)):
-            content += pdf[page_num].get_text("text")
-    return content
+    """Extract a compact structured CV from a PDF, once per uploaded file."""
+    file_key = getattr(file, "file_id", None) or f"{file.name}-{file.size}"
+    if st.session_state.get('pdf_file_key') != file_key:
+        # Failures are remembered too, so a bad file isn't re-extracted on every rerun
+        st.session_state['pdf_file_key'] = file_key
+        st.session_state['pdf_error'] = None
+        try:
+            document = ingest_pdf(file)
+            st.session_state['pdf_content'] = document.to_prompt()
+            st.session_state['pdf_report'] = document.report()
+        except PDFIngestionError as e:
+            st.session_state['pdf_error'] = str(e)
+    if st.session_state['pdf_error']:
+        raise PDFIngestionError(st.session_state['pdf_error'])
+    return st.session_state['pdf_content']
 
 # Filter actual messages
 def filter_messages(messages):
@@ -404,7 +223,8 @@ def filter_messages(messages):
     ]
     return actual_messages
 
-actual_messages = filter_messages(st.session_state['conversation_history'])
+with profiler.section("filter_messages"):
+    actual_messages = filter_messages(st.session_state['conversation_history'])
 
 # Add language selector in the sidebar (place this at the top of the sidebar)
 if 'language' not in st.session_state:
@@ -412,13 +232,14 @@ if 'language' not in st.session_state:
 
 language = st.sidebar.selectbox(
     "Select Language / Pilih Bahasa / 选择语言",
-    options=list(TRANSLATIONS.keys()),
-    index=list(TRANSLATIONS.keys()).index(st.session_state['language']),
+    options=list(LANGUAGES.keys()),
+    index=list(LANGUAGES.keys()).index(st.session_state['language']),
     key='language'
 )
 
 # Get current language translations
-trans = TRANSLATIONS[language]
+with profiler.section("translations"):
+    trans = get_translator(language)
 
 # Update the interview type selection
 interview_type = st.sidebar.selectbox(
@@ -466,13 +287,16 @@ word_count_container = st.sidebar.container()
 
 
 # Initialize the ConversationManager object
-if 'chat_manager' not in st.session_state:
-    st.session_state['chat_manager'] = ConversationManager(word_limit=word_limit)
-else:
-    st.session_state['chat_manager'].update_word_limit(word_limit)
+with profiler.section("conversation_manager"):
+    if 'chat_manager' not in st.session_state:
+        st.session_state['chat_manager'] = ConversationManager(word_limit=word_limit)
+    else:
+        st.session_state['chat_manager'].update_word_limit(word_limit)
+
+    chat_manager = st.session_state['chat_manager']
 
-chat_manager = st.session_state['chat_manager']
-chat_manager.update_system_message(trans["system_message"])
+with profiler.section("update_system_message"):
+    chat_manager.update_system_message(trans["system_message"])
 
 # Initialize conversation history in session state
 if 'conversation_history' not in st.session_state:
@@ -541,21 +365,21 @@ if st.sidebar.button(trans["export_conversation"]):
             # Create download button based on format
             if export_format == "TXT":
                 st.sidebar.download_button(
-                    label="Download TXT",
+                    label=trans["download"].format(format="TXT"),
                     data=export_content,
                     file_name=f"chat_history_{timestamp}.txt",
                     mime="text/plain"
                 )
             elif export_format == "CSV":
                 st.sidebar.download_button(
-                    label="Download CSV",
+                    label=trans["download"].format(format="CSV"),
                     data=export_content,
                     file_name=f"chat_history_{timestamp}.csv",
                     mime="text/csv"
                 )
             elif export_format == "JSON":
                 st.sidebar.download_button(
-                    label="Download JSON",
+                    label=trans["download"].format(format="JSON"),
                     data=export_content,
                     file_name=f"chat_history_{timestamp}.json",
                     mime="application/json"
@@ -575,36 +399,70 @@ if st.session_state.confirm_clear:
     col1, col2 = st.sidebar.columns([0.02, 0.06])  # Smaller columns and narrow gap
 
     with col1:
-        if st.button("Yes"):
+        if st.button(trans["yes"]):
             st.session_state['conversation_history'] = []
+            st.session_state.pop('evaluation', None)
             chat_manager.reset_conversation()
             st.session_state.confirm_clear = False
             st.rerun()
 
     with col2:
-        if st.button("No"):
+        if st.button(trans["no"]):
             st.session_state.confirm_clear = False
             st.rerun()
 
 
 
+def persist_interview():
+    """Save the current conversation to disk and return its display and stored names"""
+    # Reuse the stored copy while the conversation hasn't changed, so repeated
+    # Save/Evaluate clicks don't create duplicate candidates
+    digest = hashlib.sha256(
+        json.dumps(st.session_state["conversation_history"], sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    stored = st.session_state.get('stored_interview')
+    if stored and stored["digest"] == digest:
+        return stored["save_name"], stored["stored_name"]
+
+    save_name = f"{interview_type or 'UnknownType'}-{job_applied or 'UnknownPosition'}"
+    save_name = re.sub(r"[^\w.-]", "_", save_name)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    stored_name = f"{save_name}_{timestamp}"
+    save_interview(stored_name, st.session_state["conversation_history"], {
+        "interview_type": interview_type,
+        "job_applied": job_applied,
+        "language": language,
+    })
+    st.session_state['stored_interview'] = {
+        "digest": digest,
+        "save_name": save_name,
+        "stored_name": stored_name,
+    }
+    return save_name, stored_name
+
+
+def run_evaluation():
+    """Store and evaluate the interview, keeping the result for the Summary tab"""
+    _, stored_name = persist_interview()
+    try:
+        st.session_state['evaluation'] = evaluate_and_store(get_model_router(), stored_name)
+        return True
+    except Exception as e:
+        print(f"Error evaluating interview: {e}")
+        return False
+
+
 # Save conversation with dynamic naming
 if st.sidebar.button(trans["save_conversation"]):
     if "conversation_history" in st.session_state and st.session_state["conversation_history"]:
-        # Generate the name dynamically
-        interview_type = st.session_state.get("interview_type", "UnknownType")
-        job_applied = st.session_state.get("job_applied", "UnknownPosition")
-        save_name = f"{interview_type}-{job_applied}".replace(" ", "_")
-
-        # Ensure uniqueness by adding a timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_key = f"saved_conversation_{save_name}_{timestamp}"
+        # Generate the name dynamically, unique thanks to the timestamp
+        save_name, stored_name = persist_interview()
 
         # Save conversation in session state
-        st.session_state[unique_key] = st.session_state["conversation_history"].copy()
-        st.success(f"Conversation saved as: {save_name}")
+        st.session_state[f"saved_conversation_{stored_name}"] = st.session_state["conversation_history"].copy()
+        st.success(f"{trans['saved_as']}{save_name}")
     else:
-        st.warning("No conversation available to save!")
+        st.warning(trans["nothing_to_save"])
 
 
 # Display and load saved conversations
@@ -618,6 +476,7 @@ if saved_conversations:
     if st.sidebar.button(trans["load"]):
         st.session_state['conversation_history'] = \
             st.session_state[selected_conversation].copy()
+        st.session_state.pop('evaluation', None)
         st.rerun()  # Using st.rerun() instead of st.experimental_rerun()
 
 
@@ -627,7 +486,7 @@ if 'interview_started' not in st.session_state:
 
 
 # Tabs for different sections
-tabs = st.tabs(["Chatbot", "Summary"])
+tabs = st.tabs([trans["tab_chatbot"], trans["tab_summary"]])
 
 # Chatbot tab: Contains the chatbot UI
 with tabs[0]:
@@ -635,33 +494,47 @@ with tabs[0]:
     st.title("HireHelp")
 
     # Display EC2 Instance ID
-    instance_id = get_instance_id()
+    with profiler.section("get_instance_id"):
+        instance_id = get_instance_id()
     st.write(f"**{trans['instance_id']}**: {instance_id}")
 
     # PDF Upload
-    uploaded_file = st.file_uploader("Upload your CV in PDF format", type="pdf")
+    uploaded_file = st.file_uploader(trans["upload_cv"], type="pdf")
+    pdf_content = None
     if uploaded_file:
-        pdf_content = parse_pdf(uploaded_file)
-        st.session_state['pdf_loaded'] = True
-        st.write("✅ PDF uploaded successfully!")
+        try:
+            with profiler.section("parse_pdf"):
+                pdf_content = parse_pdf(uploaded_file)
+            st.session_state['pdf_loaded'] = True
+            st.write(trans["pdf_uploaded"])
+            report = st.session_state['pdf_report']
+            st.caption(
+                trans["pdf_report"].format(
+                    pages=report['pages'],
+                    seconds=report['extraction_time'],
+                    tokens=report['tokens']
+                )
+                + (trans["pdf_truncated"].format(total_pages=report['total_pages']) if report['truncated'] else "")
+            )
+        except PDFIngestionError as e:
+            st.session_state['pdf_loaded'] = False
+            st.warning(f"⚠️ {e}")
     else:
         st.session_state['pdf_loaded'] = False
 
     # Button to Start Interview
-    if st.button("Start Interview"):
-        if not uploaded_file:
-            st.warning("⚠️ Please upload your CV.")
+    if st.button(trans["start_interview"]):
+        if not pdf_content:
+            st.warning(trans["warn_upload_cv"])
         elif not interview_type:
-            st.warning("⚠️ Please select or input interview type.")
+            st.warning(trans["warn_interview_type"])
         elif not job_applied:
-            st.warning("⚠️ Please enter position you want to apply.")
+            st.warning(trans["warn_job_applied"])
         else:
-            # Determine model and API key based on the interview type
-            if "coding" in interview_type.lower() or interview_type == "Technical Skill":
-                chat_manager.model = CODING_MODEL
-                chat_manager.client = OpenAI(api_key=DEFAULT_API_KEY, base_url=DEFAULT_BASE_URL)
-                chat_manager.max_tokens=1024
-                chat_manager.token_budget=8192
+            # Route the interview to the healthiest endpoint for its category
+            route_name = route_for_interview(interview_type)
+            chat_manager.use_route(get_model_router(), route_name)
+            if route_name == "coding":
                 coding_prompt = (
                     f"Let's start the Practical Coding interview. Ask question one by one. "
                     f"You are an experienced coding interviewer. You can generate a code relevant to these information and ask the user the output "
@@ -674,9 +547,6 @@ with tabs[0]:
                 )
                 chat_manager.system_message = coding_prompt
             else:
-                # Use default settings for other interview types
-                chat_manager.model = DEFAULT_MODEL
-                chat_manager.client = OpenAI(api_key=DEFAULT_API_KEY, base_url=DEFAULT_BASE_URL)
                 general_prompt = (
                     f"Let's start the interview. Ask question one by one. "
                     f"Ask questions based on these information: interview type: {interview_type}, "
@@ -694,6 +564,7 @@ with tabs[0]:
 
             # Start the interview
             st.session_state['interview_started'] = True
+            st.session_state.pop('evaluation', None)
             response = chat_manager.chat_completion(chat_manager.system_message)
             st.session_state['conversation_history'] = chat_manager.conversation_history
 
@@ -706,7 +577,7 @@ with tabs[0]:
         # User input container
         user_input_container = st.container()
 
-        with chat_history_container:
+        with chat_history_container, profiler.section("chat_render"):
             # Render conversation history (skip the initial user prompt)
             for i, message in enumerate(st.session_state['conversation_history']):
                 if message["role"] != "system" and not (
@@ -722,7 +593,7 @@ with tabs[0]:
 
                 # Check if input exceeds word limit
                 if word_count > word_limit:
-                    st.warning(f"{trans['input_exceeds']} ({word_count}/{word_limit} words)")
+                    st.warning(f"{trans['input_exceeds']} ({word_count}/{word_limit} {trans['words']})")
                 else:
                     # Add language instruction before each interaction if not already added
                     if not any(
@@ -735,11 +606,17 @@ with tabs[0]:
                         })
 
                     # Generate and update AI response
-                    response = chat_manager.chat_completion(user_input)
+                    with profiler.section("chat_completion"):
+                        response = chat_manager.chat_completion(user_input)
                     st.session_state['conversation_history'] = chat_manager.conversation_history
+
+                    # The interview is over once the interviewer gives its scored judgement
+                    if response and is_closing_assessment(response):
+                        with profiler.section("evaluation"):
+                            run_evaluation()
                     st.rerun()
     else:
-        st.write("🔒 Chatbot can only be accessed after you start the interview.")
+        st.write(trans["chatbot_locked"])
     
 
 # Summary tab: Contains the conversation summary
@@ -753,9 +630,8 @@ with tabs[1]:
                 [f"{msg['role'].upper()}: {msg['content']}" for msg in actual_messages]
             )
             try:
-                summary_response = chat_manager.client.chat.completions.create(
-                    model=chat_manager.model,
-                    messages=[{
+                summary_response = chat_manager.create_completion(
+                    [{
                         "role": "system",
                         "content": "You are a helpful assistant. Please provide a concise summary of the following conversation."
                     },
@@ -768,6 +644,31 @@ with tabs[1]:
                 )
                 st.markdown(summary_response.choices[0].message.content)
             except Exception as e:
-                st.warning("⚠️ Failed to generate summary. Please try again.")
+                st.warning(trans["summary_failed"])
         else:
-            st.warning("⚠️ No conversation to summarize yet!")
+            st.warning(f"⚠️ {trans['no_summary']}")
+
+    # Structured evaluation, stored next to the saved interview
+    st.header(trans["evaluation"])
+    if st.button(trans["evaluate_interview"]):
+        if actual_messages:
+            if not run_evaluation():
+                st.warning(trans["evaluation_failed"])
+        else:
+            st.warning(trans["no_evaluation"])
+
+    # Runs automatically when the interview ends, or from the button above
+    evaluation = st.session_state.get('evaluation')
+    if evaluation:
+        st.metric(trans["overall_score"], f"{evaluation['overall_score']}/10")
+        st.table([
+            {"#": i, trans["question"]: q["question"], trans["score"]: q["score"], trans["comment"]: q["comment"]}
+            for i, q in enumerate(evaluation["questions"], start=1)
+        ])
+        st.markdown(f"**{trans['recommendations']}**")
+        for recommendation in evaluation["recommendations"]:
+            st.markdown(f"- {recommendation}")
+
+# Close this rerun's profile and show it in the sidebar
+profiler.finish_rerun()
+profiler.render_sidebar(st)
@@ -0,0 +1,203 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import Counter
+
+import fitz
+import tiktoken
+
+
+# Ingestion limits
+MAX_PDF_BYTES = 5 * 1024 * 1024   # 5 MB is plenty for a CV
+MAX_PDF_PAGES = 10                # pages past this are ignored
+MAX_CHARS_PER_PAGE = 20000        # guards against pages stuffed with hidden text
+EXTRACTION_TIMEOUT = 15           # seconds before the worker is killed
+
+# Heading keywords mapped to the section they start
+SECTION_KEYWORDS = {
+    "summary": ["summary", "profile", "about me", "objective", "ringkasan", "profil", "tentang saya"],
+    "experience": ["experience", "work experience", "employment", "work history", "professional experience",
+                   "pengalaman", "pengalaman kerja"],
+    "education": ["education", "academic background", "pendidikan"],
+    "skills": ["skills", "technical skills", "core competencies", "keahlian", "keterampilan", "kemampuan"],
+    "projects": ["projects", "proyek", "projek"],
+    "certifications": ["certifications", "certificates", "licenses", "sertifikasi", "sertifikat"],
+    "languages": ["languages", "bahasa"],
+    "awards": ["awards", "achievements", "honors", "penghargaan", "prestasi"],
+    "organizations": ["organizations", "volunteering", "organisasi"],
+}
+
+# Up to 3 digits so years like "2021" or "2021 / 2023" are never taken for page numbers
+PAGE_NUMBER_RE = re.compile(r"^(page\s*)?\d{1,3}(\s*(of|/)\s*\d{1,3})?$", re.IGNORECASE)
+
+
+class PDFIngestionError(Exception):
+    """Raised when an uploaded PDF is rejected or cannot be extracted."""
+
+
+class CVDocument:
+    """A CV split into sections, plus the cost of producing it."""
+
+    def __init__(self, sections, page_count, total_pages, extraction_time, token_count=0):
+        self.sections = sections
+        self.page_count = page_count
+        self.total_pages = total_pages
+        self.truncated = total_pages > page_count
+        self.extraction_time = extraction_time
+        self.token_count = token_count
+
+    def to_prompt(self):
+        """Render the CV as compact text for the interview prompt."""
+        parts = []
+        for name, lines in self.sections.items():
+            if lines:
+                parts.append(f"{name.upper()}: " + "; ".join(lines))
+        return "\n".join(parts)
+
+    def report(self):
+        return {
+            "pages": self.page_count,
+            "total_pages": self.total_pages,
+            "truncated": self.truncated,
+            "extraction_time": round(self.extraction_time, 3),
+            "tokens": self.token_count,
+        }
+
+
+def _extract_pages(data, max_pages):
+    """Worker entry point: return the text of the first `max_pages` pages."""
+    pages = []
+    with fitz.open(stream=data, filetype="pdf") as pdf:
+        total = len(pdf)
+        for page_num in range(min(total, max_pages)):
+            pages.append(pdf[page_num].get_text("text")[:MAX_CHARS_PER_PAGE])
+    return pages, total
+
+
+def extract_pages(data, max_pages=MAX_PDF_PAGES, timeout=EXTRACTION_TIMEOUT):
+    """Extract page text in a separate process so a hostile PDF can't stall the app."""
+    # A fresh interpreter running only this module; multiprocessing's spawn would
+    # re-run the Streamlit script (__main__) in the worker before extracting
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "pdf_ingest", str(max_pages)],
+            input=data,
+            capture_output=True,
+            timeout=timeout,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except subprocess.TimeoutExpired:
+        raise PDFIngestionError(f"PDF extraction timed out after {timeout} seconds")
+
+    if result.returncode != 0:
+        error = result.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise PDFIngestionError(f"Could not read PDF: {error[-1] if error else 'worker failed'}")
+    # The result is the last line; importing fitz may print a notice to stdout first
+    try:
+        output = json.loads(result.stdout.splitlines()[-1])
+        return output["pages"], output["total"]
+    except (IndexError, KeyError, ValueError):
+        raise PDFIngestionError("Could not read PDF: unexpected worker output")
+
+
+def normalize_lines(text):
+    """Collapse whitespace and drop empty lines."""
+    lines = []
+    for line in text.splitlines():
+        line = re.sub(r"\s+", " ", line).strip(" \t•·-–—*")
+        if line:
+            lines.append(line)
+    return lines
+
+
+def remove_headers_footers(pages, edge_lines=2):
+    """Drop page numbers and lines repeated at the top/bottom of most pages."""
+    edge_counts = Counter()
+    for lines in pages:
+        edge_counts.update(set(lines[:edge_lines] + lines[-edge_lines:]))
+
+    repeated = set()
+    if len(pages) > 1:
+        repeated = {line for line, count in edge_counts.items() if count > len(pages) / 2}
+
+    cleaned = []
+    for lines in pages:
+        kept = []
+        for i, line in enumerate(lines):
+            # Headers, footers and page numbers only live at the edges of a page
+            at_edge = i < edge_lines or i >= len(lines) - edge_lines
+            if at_edge and (line in repeated or PAGE_NUMBER_RE.match(line)):
+                continue
+            kept.append(line)
+        cleaned.append(kept)
+    return cleaned
+
+
+def match_section(line):
+    """Return the section a heading line starts, or None for body text."""
+    heading = line.lower().rstrip(":").strip()
+    if len(heading) > 40:
+        return None
+    for section, keywords in SECTION_KEYWORDS.items():
+        if heading in keywords:
+            return section
+    return None
+
+
+def structure_cv(lines):
+    """Group lines under the CV section headings they follow."""
+    sections = {"summary": []}
+    current = "summary"
+    for line in lines:
+        section = match_section(line)
+        if section:
+            current = section
+            sections.setdefault(current, [])
+            continue
+        # The same line often shows up twice within a section in multi-column layouts
+        if line in sections[current]:
+            continue
+        sections[current].append(line)
+    return sections
+
+
+def count_tokens(text):
+    return len(tiktoken.get_encoding("cl100k_base").encode(text))
+
+
+def ingest_pdf(file, max_bytes=MAX_PDF_BYTES, max_pages=MAX_PDF_PAGES, timeout=EXTRACTION_TIMEOUT):
+    """Read an uploaded PDF within size/page/time limits and return a structured CV."""
+    size = getattr(file, "size", None)
+    if size is not None and size > max_bytes:
+        raise PDFIngestionError(f"PDF is larger than {max_bytes // (1024 * 1024)} MB")
+
+    # Never read more than the limit, even if the reported size was wrong
+    data = file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise PDFIngestionError(f"PDF is larger than {max_bytes // (1024 * 1024)} MB")
+
+    start = time.monotonic()
+    pages, total_pages = extract_pages(data, max_pages=max_pages, timeout=timeout)
+    page_lines = remove_headers_footers([normalize_lines(page) for page in pages])
+    sections = structure_cv([line for lines in page_lines for line in lines])
+    document = CVDocument(
+        sections,
+        page_count=len(pages),
+        total_pages=total_pages,
+        extraction_time=time.monotonic() - start,
+    )
+    try:
+        document.token_count = count_tokens(document.to_prompt())
+    except Exception as e:
+        raise PDFIngestionError(f"Could not count CV tokens: {e}")
+    print(f"Ingested PDF {getattr(file, 'name', '')}: {document.report()}")
+    return document
+
+
+if __name__ == "__main__":
+    # Worker entry point for extract_pages: PDF bytes on stdin, page text as JSON on stdout
+    pages, total = _extract_pages(sys.stdin.buffer.read(), int(sys.argv[1]))
+    print(json.dumps({"pages": pages, "total": total}))
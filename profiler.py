@@ -0,0 +1,120 @@
+import contextlib
+import cProfile
+import json
+import os
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+
+
+FREQUENCY_WINDOW = 60       # seconds used for the reruns-per-minute figure
+
+
+class RerunProfiler:
+    """Times named sections of each Streamlit rerun for one session."""
+
+    def __init__(self, enabled=None, log_path=None, cprofile_dir=None):
+        # Settings are read here rather than at import so values from .env apply
+        if enabled is None:
+            enabled = os.getenv("HIREHELP_PROFILE", "").lower() in ("1", "true", "yes")
+        self.enabled = enabled
+        self.log_path = log_path or os.getenv("HIREHELP_PROFILE_LOG", "rerun_profile.log")
+        self.cprofile_dir = cprofile_dir or os.getenv("HIREHELP_CPROFILE_DIR", "profiles")
+        self.session_id = uuid.uuid4().hex[:8]
+        self.rerun_count = 0
+        self.rerun_times = deque()
+        self.sections = {}
+        self.started_at = None
+        self.last_mark = None
+        self.last_report = None
+        self.cprofile_next = False
+        self._cprofile = None
+
+    def start_rerun(self):
+        if not self.enabled:
+            return
+        # st.rerun() and st.stop() end the script early, so close the previous rerun here
+        if self.started_at is not None:
+            self.finish_rerun(interrupted=True)
+
+        now = time.monotonic()
+        self.rerun_count += 1
+        self.rerun_times.append(now)
+        while self.rerun_times and now - self.rerun_times[0] > FREQUENCY_WINDOW:
+            self.rerun_times.popleft()
+        self.sections = {}
+        self.started_at = self.last_mark = time.perf_counter()
+
+        if self.cprofile_next:
+            self.cprofile_next = False
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def section(self, name):
+        """Context manager timing one section; a no-op when profiling is off."""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.last_mark = time.perf_counter()
+            self.sections[name] = self.sections.get(name, 0.0) + self.last_mark - start
+
+    def finish_rerun(self, interrupted=False):
+        if not self.enabled or self.started_at is None:
+            return None
+        # An interrupted rerun is only known to have lasted until its last timed section
+        end = self.last_mark if interrupted else time.perf_counter()
+        total = end - self.started_at
+        self.started_at = None
+
+        report = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "session": self.session_id,
+            "rerun": self.rerun_count,
+            "interrupted": interrupted,
+            "total_ms": round(total * 1000, 2),
+            "reruns_per_minute": len(self.rerun_times) * 60 / FREQUENCY_WINDOW,
+            "sections_ms": {name: round(seconds * 1000, 2) for name, seconds in self.sections.items()},
+        }
+        report["sections_ms"]["other"] = round(max(0.0, total - sum(self.sections.values())) * 1000, 2)
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            os.makedirs(self.cprofile_dir, exist_ok=True)
+            path = os.path.join(self.cprofile_dir, f"rerun_{self.session_id}_{self.rerun_count}.prof")
+            self._cprofile.dump_stats(path)
+            self._cprofile = None
+            report["cprofile"] = path
+
+        try:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(report) + "\n")
+        except OSError as e:
+            print(f"Error writing profile log: {e}")
+
+        self.last_report = report
+        return report
+
+    def render_sidebar(self, st):
+        """Show the latest rerun breakdown in the sidebar."""
+        if not self.enabled or not self.last_report:
+            return
+        report = self.last_report
+        with st.sidebar.expander("Rerun Profile"):
+            st.write(
+                f"Rerun #{report['rerun']}: {report['total_ms']} ms, "
+                f"{report['reruns_per_minute']:.1f} reruns/min"
+            )
+            rows = sorted(report["sections_ms"].items(), key=lambda item: item[1], reverse=True)
+            st.table([{"Section": name, "ms": ms} for name, ms in rows])
+            if report.get("cprofile"):
+                st.caption(f"cProfile output: {report['cprofile']}")
+            if st.button("Profile next rerun with cProfile"):
+                self.cprofile_next = True
@@ -0,0 +1,226 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from openai import OpenAI
+
+
+# Built-in routes, used when no routes file is configured
+DEFAULT_BASE_URL = "https://api.together.xyz/v1"
+DEFAULT_MODEL = "meta-llama/Llama-Vision-Free"
+CODING_MODEL = "Qwen/Qwen2.5-Coder-32B-Instruct"
+DEFAULT_MAX_TOKENS = 512
+DEFAULT_TOKEN_BUDGET = 4096
+CODING_MAX_TOKENS = 1024
+CODING_TOKEN_BUDGET = 8192
+
+# Routing defaults
+WINDOW_SIZE = 20            # number of recent calls kept per endpoint
+MAX_ERROR_RATE = 0.5        # endpoints above this are only used as a last resort
+COOLDOWN_SECONDS = 30       # how long an endpoint is skipped after repeated failures
+FAILURES_BEFORE_COOLDOWN = 3
+DEFAULT_TIMEOUT = 30        # seconds per request before failing over
+MAX_RETRIES = 0             # failover to the next endpoint is the retry
+
+
+class Endpoint:
+    """A single OpenAI-compatible endpoint/model pair with rolling health stats."""
+
+    def __init__(self, name, base_url, model, api_key=None, timeout=DEFAULT_TIMEOUT):
+        self.name = name
+        self.base_url = base_url
+        self.model = model
+        self.api_key = api_key
+        self.timeout = timeout
+        self.latencies = deque(maxlen=WINDOW_SIZE)
+        self.outcomes = deque(maxlen=WINDOW_SIZE)
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self._client = None
+
+    @property
+    def client(self):
+        # Clients are reused so every request does not pay for a new connection pool
+        if self._client is None:
+            self._client = OpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                timeout=self.timeout,
+                max_retries=MAX_RETRIES,
+            )
+        return self._client
+
+    def error_rate(self):
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def reset_health(self):
+        """Forget past failures so the endpoint is probed again."""
+        self.outcomes.clear()
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def mean_latency(self):
+        if not self.latencies:
+            return 0.0
+        return sum(self.latencies) / len(self.latencies)
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "model": self.model,
+            "base_url": self.base_url,
+            "calls": len(self.outcomes),
+            "error_rate": round(self.error_rate(), 3),
+            "mean_latency": round(self.mean_latency(), 3),
+            "cooling_down": self.cooldown_until > time.monotonic(),
+        }
+
+
+class RouteConfigError(Exception):
+    """Raised when a routes file can't be used to build a router."""
+
+
+class Route:
+    """An interview category served by one or more endpoints under a shared token budget."""
+
+    def __init__(self, name, endpoints, max_tokens, token_budget):
+        self.name = name
+        self.endpoints = endpoints
+        self.max_tokens = max_tokens
+        self.token_budget = token_budget
+
+
+class ModelRouter:
+    """Pick the healthiest/fastest endpoint of a route and fail over on errors."""
+
+    def __init__(self, routes, default_route="general"):
+        self.routes = {route.name: route for route in routes}
+        self.default_route = default_route
+        self._lock = threading.Lock()
+
+    def get_route(self, name):
+        return self.routes.get(name) or self.routes[self.default_route]
+
+    def ranked_endpoints(self, route_name):
+        """Return the route's endpoints ordered best first."""
+        now = time.monotonic()
+        with self._lock:
+            endpoints = self.get_route(route_name).endpoints
+            # Unhealthy endpoints are not called, so give them a fresh start once
+            # their cooldown is over instead of excluding them forever
+            for endpoint in endpoints:
+                if endpoint.cooldown_until and endpoint.cooldown_until <= now:
+                    endpoint.reset_health()
+
+            def score(endpoint):
+                cooling = endpoint.cooldown_until > now
+                unhealthy = endpoint.error_rate() > MAX_ERROR_RATE
+                # Untried endpoints have a mean latency of 0 so they get probed early
+                return (cooling, unhealthy, endpoint.mean_latency() * (1 + endpoint.error_rate()))
+            return sorted(endpoints, key=score)
+
+    def record(self, endpoint, latency, ok):
+        with self._lock:
+            endpoint.outcomes.append(ok)
+            if ok:
+                endpoint.latencies.append(latency)
+                endpoint.consecutive_failures = 0
+                endpoint.cooldown_until = 0.0
+            else:
+                endpoint.consecutive_failures += 1
+                if (endpoint.consecutive_failures >= FAILURES_BEFORE_COOLDOWN
+                        or endpoint.error_rate() > MAX_ERROR_RATE):
+                    endpoint.cooldown_until = time.monotonic() + COOLDOWN_SECONDS
+
+    def create(self, route_name, messages, **kwargs):
+        """Run a chat completion on the best endpoint, trying the others if it fails."""
+        last_error = None
+        for endpoint in self.ranked_endpoints(route_name):
+            start = time.monotonic()
+            try:
+                response = endpoint.client.chat.completions.create(
+                    model=endpoint.model,
+                    messages=messages,
+                    **kwargs
+                )
+            except Exception as e:
+                self.record(endpoint, time.monotonic() - start, False)
+                print(f"Endpoint {endpoint.name} failed: {e}")
+                last_error = e
+                continue
+            self.record(endpoint, time.monotonic() - start, True)
+            return response
+        raise last_error or RuntimeError(f"No endpoints configured for route {route_name}")
+
+    def stats(self):
+        with self._lock:
+            return {
+                name: [endpoint.stats() for endpoint in route.endpoints]
+                for name, route in self.routes.items()
+            }
+
+
+def load_routes(path, default_api_key=None, default_route="general"):
+    """Load routes from a JSON file.
+
+    The file maps a route name to its budgets and endpoints, e.g.
+    {"coding": {"max_tokens": 1024, "token_budget": 8192,
+                "endpoints": [{"base_url": "...", "model": "...", "api_key_env": "..."}]}}
+    It must define the default route, which serves any category without its own route.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    if default_route not in config:
+        raise RouteConfigError(f"{path}: missing the default '{default_route}' route")
+    try:
+        return [
+            _route_from_config(route_name, route_config, default_api_key)
+            for route_name, route_config in config.items()
+        ]
+    except KeyError as e:
+        raise RouteConfigError(f"{path}: missing {e} setting")
+
+
+def _route_from_config(route_name, route_config, default_api_key):
+    if not route_config["endpoints"]:
+        raise RouteConfigError(f"Route '{route_name}' has no endpoints")
+    endpoints = []
+    for i, endpoint_config in enumerate(route_config["endpoints"]):
+        api_key = default_api_key
+        if endpoint_config.get("api_key_env"):
+            api_key = os.getenv(endpoint_config["api_key_env"])
+        endpoints.append(Endpoint(
+            name=endpoint_config.get("name", f"{route_name}-{i}"),
+            base_url=endpoint_config["base_url"],
+            model=endpoint_config["model"],
+            api_key=api_key,
+            timeout=endpoint_config.get("timeout", DEFAULT_TIMEOUT),
+        ))
+    return Route(
+        route_name,
+        endpoints,
+        max_tokens=route_config["max_tokens"],
+        token_budget=route_config["token_budget"],
+    )
+
+
+def default_routes(api_key=None):
+    """Built-in general and coding routes on the default provider."""
+    return [
+        Route("general", [Endpoint("general-default", DEFAULT_BASE_URL, DEFAULT_MODEL, api_key)],
+              max_tokens=DEFAULT_MAX_TOKENS, token_budget=DEFAULT_TOKEN_BUDGET),
+        Route("coding", [Endpoint("coding-default", DEFAULT_BASE_URL, CODING_MODEL, api_key)],
+              max_tokens=CODING_MAX_TOKENS, token_budget=CODING_TOKEN_BUDGET),
+    ]
+
+
+def build_router(routes_file=None, api_key=None):
+    """Build a router from a routes file, or from the built-in routes when none is given."""
+    if routes_file:
+        return ModelRouter(load_routes(routes_file, default_api_key=api_key))
+    return ModelRouter(default_routes(api_key))
@@ -0,0 +1,82 @@
+import json
+import os
+
+import pytest
+
+from evaluation import (
+    EvaluationError,
+    compact_transcript,
+    is_closing_assessment,
+    parse_evaluation,
+    rank_candidates,
+    save_interview,
+)
+
+
+def reply(**overrides):
+    result = {
+        "questions": [{"question": "Why us?", "score": 8, "comment": "Clear"}],
+        "overall_score": 7,
+        "recommendations": ["Give examples"],
+    }
+    result.update(overrides)
+    return json.dumps(result)
+
+
+def test_parses_and_clamps_scores():
+    result = parse_evaluation(reply(overall_score=12))
+    assert result["overall_score"] == 10
+    assert result["questions"][0]["score"] == 8
+
+
+@pytest.mark.parametrize("overrides", [
+    {"overall_score": "8/10"},
+    {"questions": None},
+    {"questions": [{"question": "Why us?", "score": "high"}]},
+    {"recommendations": "none"},
+])
+def test_malformed_evaluations_raise_evaluation_error(overrides):
+    with pytest.raises(EvaluationError):
+        parse_evaluation(reply(**overrides))
+
+
+def test_rank_candidates_reads_stored_results(tmp_path):
+    for name, score in [("a", 5), ("b", 9)]:
+        save_interview(name, [], directory=str(tmp_path))
+        (tmp_path / f"{name}.eval.json").write_text(json.dumps({
+            "name": name, "saved_at": "2026-10-19T10:00:00", "overall_score": score, "metadata": {},
+        }))
+    assert [e["name"] for e in rank_candidates(str(tmp_path), date="2026-10-19")] == ["b", "a"]
+
+
+def test_transcript_leaves_out_prompts_and_closing_assessment():
+    messages = [
+        {"role": "system", "content": "You are an interviewer. CV content: ..."},
+        {"role": "user", "content": "Let's start the interview. CV content: ..."},
+        {"role": "assistant", "content": "Tell me about yourself."},
+        {"role": "user", "content": "I build APIs."},
+        {"role": "assistant", "content": "Good effort. Score: 6/10. Practise system design."},
+    ]
+    assert compact_transcript(messages) == "Q: Tell me about yourself.\nA: I build APIs."
+
+
+def test_closing_assessment_detection():
+    assert is_closing_assessment("Overall I would give you 7 out of 10.")
+    assert is_closing_assessment("Skor Anda: 8 dari 10")
+    assert not is_closing_assessment("Which of these 10 tools have you used?")
+
+
+def test_interviews_dir_is_read_after_loading_dotenv(monkeypatch):
+    import importlib
+
+    import dotenv
+    import evaluation
+
+    # Stand-in for a .env file that sets INTERVIEWS_DIR
+    monkeypatch.delenv("INTERVIEWS_DIR", raising=False)
+    monkeypatch.setattr(dotenv, "load_dotenv", lambda *args, **kwargs: os.environ.update(INTERVIEWS_DIR="custom_dir"))
+    try:
+        assert importlib.reload(evaluation).INTERVIEWS_DIR == "custom_dir"
+    finally:
+        monkeypatch.undo()
+        importlib.reload(evaluation)
@@ -0,0 +1,86 @@
+import io
+import sys
+import types
+
+import fitz
+import pytest
+
+import pdf_ingest
+from pdf_ingest import PDFIngestionError, extract_pages, ingest_pdf, remove_headers_footers, structure_cv
+
+
+def test_years_and_body_numbers_are_kept():
+    pages = [
+        ["Jane Doe", "Experience", "2019", "2021 / 2023", "12", "Engineer", "1"],
+        ["Jane Doe", "Education", "2015", "Page 2 of 2"],
+    ]
+    cleaned = remove_headers_footers(pages)
+    assert cleaned == [
+        ["Experience", "2019", "2021 / 2023", "12", "Engineer"],
+        ["Education", "2015"],
+    ]
+
+
+def test_duplicates_are_only_removed_within_a_section():
+    sections = structure_cv(["Skills", "Python", "Python", "Projects", "Python"])
+    assert sections["skills"] == ["Python"]
+    assert sections["projects"] == ["Python"]
+
+
+def make_pdf(page_count):
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_text((50, 80), "Skills")
+        page.insert_text((50, 100), f"Skill {i}")
+    buffer = io.BytesIO(doc.tobytes())
+    buffer.name = "cv.pdf"
+    return buffer
+
+
+def test_report_counts_processed_and_total_pages(monkeypatch):
+    monkeypatch.setattr(pdf_ingest, "count_tokens", lambda text: len(text.split()))
+    document = ingest_pdf(make_pdf(3), max_pages=2)
+    report = document.report()
+    assert report["pages"] == 2
+    assert report["total_pages"] == 3
+    assert report["truncated"]
+
+
+def test_token_count_errors_become_ingestion_errors(monkeypatch):
+    def broken(text):
+        raise OSError("encoding unavailable")
+
+    monkeypatch.setattr(pdf_ingest, "count_tokens", broken)
+    with pytest.raises(PDFIngestionError):
+        ingest_pdf(make_pdf(1))
+
+
+def test_oversized_pdf_is_rejected():
+    with pytest.raises(PDFIngestionError):
+        ingest_pdf(io.BytesIO(b"x" * 20), max_bytes=10)
+
+
+def test_worker_does_not_run_the_app_script(tmp_path, monkeypatch):
+    # Streamlit runs main.py as __main__; the worker must not execute it again
+    marker = tmp_path / "script_ran"
+    script = tmp_path / "app.py"
+    script.write_text(f"open({str(marker)!r}, 'w').close()\n")
+    fake_main = types.ModuleType("__main__")
+    fake_main.__file__ = str(script)
+    monkeypatch.setitem(sys.modules, "__main__", fake_main)
+
+    pages, total = extract_pages(make_pdf(2).getvalue())
+    assert total == 2
+    assert len(pages) == 2
+    assert not marker.exists()
+
+
+def test_extraction_timeout_raises_ingestion_error():
+    with pytest.raises(PDFIngestionError):
+        extract_pages(make_pdf(1).getvalue(), timeout=0.001)
+
+
+def test_unreadable_pdf_raises_ingestion_error():
+    with pytest.raises(PDFIngestionError):
+        extract_pages(b"not a pdf")
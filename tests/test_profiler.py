@@ -0,0 +1,64 @@
+import json
+
+import profiler
+from profiler import RerunProfiler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_profiler(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(profiler.time, "perf_counter", clock)
+    monkeypatch.setattr(profiler.time, "monotonic", clock)
+    return RerunProfiler(enabled=True, log_path=str(tmp_path / "profile.log")), clock
+
+
+def test_interrupted_rerun_ends_at_last_section(tmp_path, monkeypatch):
+    rerun_profiler, clock = make_profiler(tmp_path, monkeypatch)
+    rerun_profiler.start_rerun()
+    with rerun_profiler.section("chat_completion"):
+        clock.now += 0.5
+    # st.rerun() stops the script here; the user then idles before the next rerun
+    clock.now += 30
+    rerun_profiler.start_rerun()
+
+    with open(tmp_path / "profile.log", encoding="utf-8") as f:
+        report = json.loads(f.readline())
+    assert report["interrupted"]
+    assert report["total_ms"] == 500.0
+    assert report["sections_ms"] == {"chat_completion": 500.0, "other": 0.0}
+
+
+def test_reruns_per_minute_only_counts_the_window(tmp_path, monkeypatch):
+    rerun_profiler, clock = make_profiler(tmp_path, monkeypatch)
+    for _ in range(3):
+        rerun_profiler.start_rerun()
+        rerun_profiler.finish_rerun()
+        clock.now += 10
+    clock.now += profiler.FREQUENCY_WINDOW
+    rerun_profiler.start_rerun()
+    assert rerun_profiler.finish_rerun()["reruns_per_minute"] == 1.0
+
+
+def test_disabled_profiler_is_a_no_op(tmp_path):
+    rerun_profiler = RerunProfiler(enabled=False, log_path=str(tmp_path / "profile.log"))
+    rerun_profiler.start_rerun()
+    with rerun_profiler.section("parse_pdf"):
+        pass
+    assert rerun_profiler.finish_rerun() is None
+    assert rerun_profiler.sections == {}
+    assert not (tmp_path / "profile.log").exists()
+
+
+def test_settings_are_read_when_the_profiler_is_created(monkeypatch):
+    monkeypatch.setenv("HIREHELP_PROFILE", "1")
+    monkeypatch.setenv("HIREHELP_PROFILE_LOG", "custom.log")
+    rerun_profiler = RerunProfiler()
+    assert rerun_profiler.enabled
+    assert rerun_profiler.log_path == "custom.log"
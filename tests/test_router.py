@@ -0,0 +1,76 @@
+import json
+import time
+
+import pytest
+
+import router
+from router import Endpoint, ModelRouter, Route, RouteConfigError, build_router, load_routes
+
+
+def make_router():
+    primary = Endpoint("primary", "http://primary", "model")
+    backup = Endpoint("backup", "http://backup", "model")
+    route = Route("general", [primary, backup], max_tokens=512, token_budget=4096)
+    return ModelRouter([route]), primary, backup
+
+
+def test_faster_endpoint_ranks_first():
+    model_router, primary, backup = make_router()
+    model_router.record(primary, 0.2, True)
+    model_router.record(backup, 2.0, True)
+    assert model_router.ranked_endpoints("general")[0] is primary
+
+
+def test_failed_endpoint_is_probed_again_after_cooldown(monkeypatch):
+    model_router, primary, backup = make_router()
+    model_router.record(primary, 0.2, False)
+    model_router.record(backup, 2.0, True)
+    assert model_router.ranked_endpoints("general")[0] is backup
+
+    # Once the cooldown is over the primary gets traffic again
+    later = time.monotonic() + router.COOLDOWN_SECONDS + 1
+    monkeypatch.setattr(router.time, "monotonic", lambda: later)
+    assert model_router.ranked_endpoints("general")[0] is primary
+    assert primary.error_rate() == 0.0
+
+
+def test_endpoints_default_to_a_short_timeout_without_retries():
+    endpoint = Endpoint("primary", "http://primary", "model", api_key="test")
+    assert endpoint.timeout == router.DEFAULT_TIMEOUT
+    assert endpoint.client.max_retries == router.MAX_RETRIES
+
+
+def test_builtin_routes_are_used_without_a_routes_file():
+    model_router = build_router(None, api_key="test")
+    assert set(model_router.routes) == {"general", "coding"}
+
+
+def write_routes(tmp_path, config):
+    path = tmp_path / "routes.json"
+    path.write_text(json.dumps(config))
+    return str(path)
+
+
+def route_config(endpoints):
+    return {"max_tokens": 512, "token_budget": 4096, "endpoints": endpoints}
+
+
+ENDPOINT = {"base_url": "http://primary", "model": "model"}
+
+
+def test_routes_file_loads(tmp_path):
+    path = write_routes(tmp_path, {"general": route_config([ENDPOINT])})
+    routes = load_routes(path)
+    assert routes[0].name == "general"
+    assert routes[0].endpoints[0].timeout == router.DEFAULT_TIMEOUT
+
+
+@pytest.mark.parametrize("config", [
+    {"coding": route_config([ENDPOINT])},
+    {"general": route_config([])},
+    {"general": route_config([ENDPOINT]), "coding": route_config([])},
+    {"general": {"endpoints": [ENDPOINT]}},
+])
+def test_unusable_routes_files_are_rejected(tmp_path, config):
+    with pytest.raises(RouteConfigError):
+        load_routes(write_routes(tmp_path, config))
@@ -0,0 +1,44 @@
+import string
+import time
+
+import translations
+from translations import FALLBACK_LANGUAGE, LANGUAGES, load_language, missing_keys
+
+
+def placeholders(text):
+    return {name for _, name, _, _ in string.Formatter().parse(text) if name}
+
+
+def test_every_language_has_every_key():
+    assert missing_keys() == {}
+
+
+def test_no_language_has_extra_keys():
+    reference = set(load_language(FALLBACK_LANGUAGE))
+    for language in LANGUAGES:
+        assert set(load_language(language)) <= reference, language
+
+
+def test_placeholders_match_english():
+    reference = load_language(FALLBACK_LANGUAGE)
+    for language in LANGUAGES:
+        strings = load_language(language)
+        for key, text in reference.items():
+            assert placeholders(strings[key]) == placeholders(text), f"{language}: {key}"
+
+
+def test_catalog_load_time(monkeypatch):
+    monkeypatch.setattr(translations, "_catalog", {})
+    monkeypatch.setattr(translations, "LOAD_TIMES", {})
+    start = time.perf_counter()
+    for language in LANGUAGES:
+        load_language(language)
+    elapsed = time.perf_counter() - start
+
+    print(f"Loaded {len(LANGUAGES)} languages in {elapsed * 1000:.2f} ms")
+    assert set(translations.LOAD_TIMES) == set(LANGUAGES)
+    assert elapsed < 0.5
+
+
+def test_languages_are_loaded_once():
+    assert load_language("French") is load_language("French")
@@ -0,0 +1,74 @@
+import json
+import os
+import threading
+import time
+from types import MappingProxyType
+
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+FALLBACK_LANGUAGE = "English"
+
+_lock = threading.Lock()
+_catalog = {}
+_reported_missing = set()
+
+# Seconds spent loading each language, for profiling
+LOAD_TIMES = {}
+
+
+def _read_json(filename):
+    with open(os.path.join(LOCALES_DIR, filename), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Display name -> locale file code, in selector order
+LANGUAGES = _read_json("index.json")
+
+
+def load_language(language):
+    """Load a language on first use; later calls (from any session) reuse it."""
+    strings = _catalog.get(language)
+    if strings is not None:
+        return strings
+    with _lock:
+        if language not in _catalog:
+            start = time.perf_counter()
+            # Read-only view so sessions can share one copy safely
+            _catalog[language] = MappingProxyType(_read_json(f"{LANGUAGES[language]}.json"))
+            LOAD_TIMES[language] = time.perf_counter() - start
+        return _catalog[language]
+
+
+class Translator:
+    """Lookup for one language that falls back to English for missing keys."""
+
+    def __init__(self, language):
+        self.language = language
+        self.strings = load_language(language)
+
+    def __getitem__(self, key):
+        try:
+            return self.strings[key]
+        except KeyError:
+            if (self.language, key) not in _reported_missing:
+                _reported_missing.add((self.language, key))
+                print(f"Missing translation for '{key}' in {self.language}")
+            return load_language(FALLBACK_LANGUAGE)[key]
+
+
+def get_translator(language):
+    if language not in LANGUAGES:
+        language = FALLBACK_LANGUAGE
+    return Translator(language)
+
+
+def missing_keys():
+    """Return the keys each language lacks compared to English."""
+    reference = set(load_language(FALLBACK_LANGUAGE))
+    missing = {}
+    for language in LANGUAGES:
+        keys = reference - set(load_language(language))
+        if keys:
+            missing[language] = sorted(keys)
+    return missing
+